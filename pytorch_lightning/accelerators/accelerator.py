@@ -13,21 +13,155 @@
 # limitations under the License.
 import contextlib
 from abc import abstractmethod
-from typing import Any, Callable, Dict, Generator, List, Optional, Union
+from collections import defaultdict, OrderedDict
+from typing import Any, Callable, Dict, Generator, List, Optional, Tuple, Union
 
 import torch
 from torch import Tensor
+from torch._utils import _flatten_dense_tensors, _unflatten_dense_tensors
 from torch.cuda.amp import GradScaler
 from torch.nn import Module
 from torch.optim import Optimizer
 
 import pytorch_lightning as pl
-from pytorch_lightning.plugins.precision import ApexMixedPrecisionPlugin, NativeMixedPrecisionPlugin, PrecisionPlugin
-from pytorch_lightning.plugins.training_type import DataParallelPlugin, TrainingTypePlugin
+from pytorch_lightning.plugins.precision.precision_plugin import PrecisionPlugin
+from pytorch_lightning.plugins.training_type.training_type_plugin import TrainingTypePlugin
 from pytorch_lightning.trainer.states import TrainerFn
-from pytorch_lightning.utilities.apply_func import apply_to_collection, move_data_to_device
-from pytorch_lightning.utilities.enums import AMPType, LightningEnum
+from pytorch_lightning.utilities.apply_func import _is_namedtuple, apply_to_collection, move_data_to_device
+from pytorch_lightning.utilities.enums import LightningEnum
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from pytorch_lightning.utilities.model_helpers import is_overridden
 from pytorch_lightning.utilities.types import STEP_OUTPUT
+from pytorch_lightning.utilities.warnings import WarningCache
+
+warning_cache = WarningCache()
+
+
+class _BatchSchemaMismatch(Exception):
+    """Raised when a batch no longer matches the structure its schema was compiled from."""
+
+
+# container leaves that are known to hold no tensors and can be passed through by reference
+_SCHEMA_CONSTANT_TYPES = (bool, int, float, str, bytes, type(None))
+
+
+def _compile_schema_node(node: Any) -> Optional[Tuple[Callable, Callable, bool]]:
+    """Compiles one node of a batch container into ``(collect, rebuild, has_tensor)`` callables.
+
+    ``collect(node, out)`` appends the tensor leaves to ``out`` and ``rebuild(node, moved)`` reconstructs the
+    container with the tensors drawn from the ``moved`` iterator. Returns ``None`` for node types whose handling
+    cannot be compiled ahead of time (those batches keep using :func:`apply_to_collection`).
+    """
+    if isinstance(node, Tensor):
+
+        def collect(n: Any, out: List[Tensor]) -> None:
+            if not isinstance(n, Tensor):
+                raise _BatchSchemaMismatch
+            out.append(n)
+
+        return collect, (lambda n, moved: next(moved)), True
+
+    if isinstance(node, _SCHEMA_CONSTANT_TYPES):
+        constant_type = type(node)
+
+        def collect_constant(n: Any, out: List[Tensor]) -> None:
+            if type(n) is not constant_type:
+                # a leaf that held a plain value now carries a tensor or a container that may hold tensors
+                raise _BatchSchemaMismatch
+
+        return collect_constant, (lambda n, moved: n), False
+
+    node_type = type(node)
+    if node_type is list or node_type is tuple or _is_namedtuple(node):
+        compiled = [_compile_schema_node(item) for item in node]
+        if any(item is None for item in compiled):
+            return None
+        collects = tuple(item[0] for item in compiled)
+        rebuilds = tuple(item[1] for item in compiled)
+        length = len(node)
+
+        def collect(n: Any, out: List[Tensor]) -> None:
+            if type(n) is not node_type or len(n) != length:
+                raise _BatchSchemaMismatch
+            for item, collect_item in zip(n, collects):
+                collect_item(item, out)
+
+        if _is_namedtuple(node):
+
+            def rebuild(n: Any, moved: Any) -> Any:
+                return node_type(*(rebuild_item(item, moved) for item, rebuild_item in zip(n, rebuilds)))
+
+        else:
+
+            def rebuild(n: Any, moved: Any) -> Any:
+                return node_type(rebuild_item(item, moved) for item, rebuild_item in zip(n, rebuilds))
+
+        return collect, rebuild, any(item[2] for item in compiled)
+
+    if node_type is dict or node_type is OrderedDict:
+        keys = tuple(node)
+        compiled = [_compile_schema_node(value) for value in node.values()]
+        if any(item is None for item in compiled):
+            return None
+        collects = tuple(item[0] for item in compiled)
+        rebuilds = tuple(item[1] for item in compiled)
+
+        def collect(n: Any, out: List[Tensor]) -> None:
+            if type(n) is not node_type or tuple(n) != keys:
+                raise _BatchSchemaMismatch
+            for key, collect_item in zip(keys, collects):
+                collect_item(n[key], out)
+
+        def rebuild(n: Any, moved: Any) -> Any:
+            return node_type((key, rebuild_item(n[key], moved)) for key, rebuild_item in zip(keys, rebuilds))
+
+        return collect, rebuild, any(item[2] for item in compiled)
+
+    return None
+
+
+def _compile_batch_schema(batch: Any) -> Optional[Tuple[Callable, Callable]]:
+    """Compiles the container structure of a batch into a ``(collect, rebuild)`` pair.
+
+    Since the batch schema is usually stable across iterations, the compiled callables replace the per-batch
+    isinstance dispatch of :func:`apply_to_collection` with plain indexing.
+    """
+    compiled = _compile_schema_node(batch)
+    if compiled is None or not compiled[2]:
+        # unsupported structure or no tensors to move
+        return None
+    return compiled[0], compiled[1]
+
+
+def _step_args_to_tuple(step_args: Union[Tuple[Any, ...], Dict[str, Any]], step_name: str) -> Tuple[Any, ...]:
+    """Converts the deprecated dictionary of step arguments to the positional tuple the plugins expect."""
+    if isinstance(step_args, dict):
+        warning_cache.deprecation(
+            f"Passing a dictionary of arguments to `Accelerator.{step_name}` is deprecated in v1.6 and will be"
+            " removed in v1.8. Pass a tuple of positional arguments instead."
+        )
+        step_args = tuple(step_args.values())
+    return step_args
+
+
+class _SpecializedStep:
+    """Picklable specialization of an :class:`Accelerator` step method.
+
+    Baking the precision context factory and the plugin step method in at setup time turns the per-call attribute
+    chains of the generic step methods into plain instance-slot loads. A class (rather than a closure) keeps the
+    specialized steps picklable for the spawn-based plugins, which serialize the accelerator into the worker
+    processes.
+    """
+
+    def __init__(self, step_name: str, step_context: Callable, step_fn: Callable) -> None:
+        self.step_name = step_name
+        self.step_context = step_context
+        self.step_fn = step_fn
+
+    def __call__(self, step_args: Union[Tuple[Any, ...], Dict[str, Any]]) -> Optional[STEP_OUTPUT]:
+        step_args = _step_args_to_tuple(step_args, self.step_name)
+        with self.step_context():
+            return self.step_fn(*step_args)
 
 
 class Accelerator:
@@ -44,25 +178,118 @@ class Accelerator:
     One to handle differences from the training routine and one to handle different precisions.
     """
 
-    def __init__(self, precision_plugin: PrecisionPlugin, training_type_plugin: TrainingTypePlugin) -> None:
+    # whether the optimizer state transfer in ``pre_dispatch`` may overlap the training type plugin pre-dispatch.
+    # subclasses whose plugins read the optimizer state during pre-dispatch should disable this
+    overlap_pre_dispatch: bool = True
+
+    def __init__(
+        self,
+        precision_plugin: PrecisionPlugin,
+        training_type_plugin: TrainingTypePlugin,
+        bucket_cap_mb: Optional[int] = None,
+    ) -> None:
         """
         Args:
             precision_plugin: the plugin to handle precision-specific parts
             training_type_plugin: the plugin to handle different training routines
+            bucket_cap_mb: size of the gradient allreduce buckets in MiB, forwarded to
+                :class:`~torch.nn.parallel.DistributedDataParallel` when the training type plugin wraps the model
+                with it. Larger buckets issue fewer collectives at the cost of later overlap with the backward pass.
+                When ``None``, the torch default of 25 MiB is kept.
         """
         self.precision_plugin = precision_plugin
         self.training_type_plugin = training_type_plugin
+        self._bucket_cap_mb = bucket_cap_mb
 
         self.optimizers: List = []
         self.lr_schedulers: List = []
         self.optimizer_frequencies: List = []
 
+        # resolve the amp backend once instead of re-running the checks on every access. the mixed precision
+        # plugins all advertise their backend as an immutable class attribute, so no plugin imports are needed here
+        self._amp_backend: Optional[LightningEnum] = getattr(precision_plugin, "backend", None)
+
+        # local import so that importing this module does not pull in the whole plugin zoo
+        from pytorch_lightning.plugins.training_type.dp import DataParallelPlugin
+
+        self._is_data_parallel = isinstance(training_type_plugin, DataParallelPlugin)
+
+        # resolved once here: only the sharded plugins collate the optimizer state themselves
+        self._optimizer_state_fn: Optional[Callable] = getattr(training_type_plugin, "optimizer_state", None)
+
+        # per-step context factories, bound to the precision plugin in ``setup_precision_plugin``. the plugins are
+        # deliberately not dereferenced here so that construction stays lazy and plugin validation in ``setup``
+        # keeps raising its own errors
+        self._train_step_context: Optional[Callable] = None
+        self._val_step_context: Optional[Callable] = None
+        self._test_step_context: Optional[Callable] = None
+        self._predict_step_context: Optional[Callable] = None
+
+        # memoized values resolved through the training type plugin. these are on the per-batch hot path, so they
+        # are cached here instead of chasing two attribute lookups on every access
+        self._lightning_module: Optional["pl.LightningModule"] = None
+        self._root_device: Optional[torch.device] = None
+
+        # in-flight optimizer state transfer, see :meth:`_start_optimizer_state_move`
+        self._optimizer_state_copy_stream: Optional["torch.cuda.Stream"] = None
+        self._optimizer_state_staging: List[Tensor] = []
+
+        # compiled traversal of the batch structure, see :func:`_compile_batch_schema`
+        self._batch_schema_cache: Optional[Union[bool, Tuple[Callable, Callable]]] = None
+
+        # whether any of the batch-transfer hooks is overridden, resolved in ``setup``. defaults to ``True`` so
+        # that calls before setup keep routing through the hook handler
+        self._has_custom_batch_transfer = True
+
+    def _bind_step_contexts(self) -> None:
+        """Binds the precision plugin step-context factories once so the step methods do not chase the plugin
+        attribute chain per call."""
+        self._train_step_context = self.precision_plugin.train_step_context
+        self._val_step_context = self.precision_plugin.val_step_context
+        self._test_step_context = self.precision_plugin.test_step_context
+        self._predict_step_context = self.precision_plugin.predict_step_context
+
+        # specialize the step entry points with the bound plugin callables. the instance attribute shadows the
+        # generic class method, which stays in place for subclasses that override it
+        cls = type(self)
+        for name, step_context in (
+            ("training_step", self._train_step_context),
+            ("validation_step", self._val_step_context),
+            ("test_step", self._test_step_context),
+            ("predict_step", self._predict_step_context),
+        ):
+            if getattr(cls, name) is not getattr(Accelerator, name):
+                continue
+            step_fn = getattr(self.training_type_plugin, name)
+            if name == "training_step" and self.training_type_plugin.supports_pipeline:
+                # pipeline-parallel plugins run their microbatch schedule in place of a single forward
+                step_fn = self.training_type_plugin.run_microbatch_schedule
+            setattr(self, name, _SpecializedStep(name, step_context, step_fn))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # drop the memoized values so processes re-created from this accelerator (e.g. with the spawn plugins)
+        # resolve them again against their own plugin state. CUDA streams cannot be pickled either
+        state = self.__dict__.copy()
+        state["_lightning_module"] = None
+        state["_root_device"] = None
+        state["_batch_schema_cache"] = None
+        state["_optimizer_state_copy_stream"] = None
+        state["_optimizer_state_staging"] = []
+        return state
+
     def setup_environment(self) -> None:
         """Setup any processes or distributed connections.
 
         This is called before the LightningModule/DataModule setup hook which allows the user to access the accelerator
         environment before setup is complete.
         """
+        # the trainer attaches the model through ``training_type_plugin.connect`` without going through the
+        # ``model`` setter, so a reused trainer may hold a different module by now: drop everything memoized
+        # from the previous run
+        self._lightning_module = None
+        self._root_device = None
+        self._batch_schema_cache = None
+        self._has_custom_batch_transfer = True
         self.training_type_plugin.setup_environment()
 
     def setup(self, trainer: "pl.Trainer") -> None:
@@ -76,11 +303,22 @@ class Accelerator:
             self.setup_optimizers(trainer)
         self.setup_precision_plugin()
 
+        lightning_module = self.lightning_module
+        self._has_custom_batch_transfer = lightning_module is None or any(
+            is_overridden(hook, lightning_module)
+            for hook in ("on_before_batch_transfer", "transfer_batch_to_device", "on_after_batch_transfer")
+        )
+
     def pre_dispatch(self, trainer: "pl.Trainer") -> None:
         """Hook to do something before the training/evaluation/prediction starts."""
-        self._move_optimizer_state()
+        if self.overlap_pre_dispatch and not self.training_type_plugin.pre_dispatch_uses_optimizer_state:
+            # the copies run on a dedicated stream, so the training type plugin pre-dispatch overlaps with them
+            self._start_optimizer_state_move()
+        else:
+            self._move_optimizer_state()
 
         self.training_type_plugin.pre_dispatch()
+        self._wait_optimizer_state_move()
         if self.training_type_plugin.setup_optimizers_in_pre_dispatch:
             self.setup_optimizers(trainer)
 
@@ -88,11 +326,92 @@ class Accelerator:
 
     def _move_optimizer_state(self, device: Optional[torch.device] = None) -> None:
         """Moves the state of the optimizers to the GPU if needed."""
+        self._start_optimizer_state_move(device)
+        self._wait_optimizer_state_move()
+
+    def _start_optimizer_state_move(self, device: Optional[torch.device] = None) -> None:
+        """Enqueues the optimizer state transfer without waiting for it to finish.
+
+        A matching :meth:`_wait_optimizer_state_move` must run before the optimizer state is used.
+        """
         device = device or self.root_device
+        if device.type == "cuda":
+            # enqueue all copies on a dedicated stream so they are coalesced instead of launched one per tensor
+            copy_stream = torch.cuda.Stream(device=device)
+            staging: List[Tensor] = []
+            for opt in self.optimizers:
+                self._bulk_move_optimizer_state(opt, device, copy_stream, staging)
+            # the host-side staging buffers must stay alive until the copies have finished
+            self._optimizer_state_copy_stream = copy_stream
+            self._optimizer_state_staging = staging
+            return
         for opt in self.optimizers:
             for p, v in opt.state.items():
                 opt.state[p] = apply_to_collection(v, torch.Tensor, move_data_to_device, device)
 
+    def _wait_optimizer_state_move(self) -> None:
+        """Blocks until an in-flight optimizer state transfer has finished."""
+        if self._optimizer_state_copy_stream is not None:
+            self._optimizer_state_copy_stream.synchronize()
+            self._optimizer_state_copy_stream = None
+            self._optimizer_state_staging = []
+
+    @staticmethod
+    def _bulk_move_optimizer_state(
+        optimizer: Optimizer,
+        device: torch.device,
+        copy_stream: "torch.cuda.Stream",
+        staging: Optional[List[Tensor]] = None,
+    ) -> None:
+        """Transfers the tensor state of an optimizer with one coalesced copy per dtype group.
+
+        Each group is copied with a single ``torch._foreach_copy_`` kernel launch when available, otherwise the
+        tensors are flattened into a pinned staging buffer and moved in one asynchronous bulk transfer. Both paths
+        replace one synchronous ``cudaMemcpy`` launch per state tensor. Pinned staging buffers are appended to
+        ``staging`` so the caller can keep them alive until the copies have finished.
+        """
+        groups: Dict[Tuple[torch.dtype, torch.device], List[Tuple[Dict, Any, Tensor]]] = defaultdict(list)
+        for p, state in optimizer.state.items():
+            if not isinstance(state, dict):
+                optimizer.state[p] = apply_to_collection(state, Tensor, move_data_to_device, device)
+                continue
+            for key, value in state.items():
+                if isinstance(value, Tensor):
+                    if value.device == device:
+                        continue
+                    if value.is_sparse:
+                        # sparse tensors cannot be flattened or foreach-copied, move them individually
+                        state[key] = move_data_to_device(value, device)
+                    else:
+                        groups[(value.dtype, value.device)].append((state, key, value))
+                elif isinstance(value, (dict, list, tuple)):
+                    state[key] = apply_to_collection(value, Tensor, move_data_to_device, device)
+
+        foreach_copy = getattr(torch, "_foreach_copy_", None)
+        with torch.cuda.stream(copy_stream):
+            for (_, source_device), entries in groups.items():
+                tensors = [entry[2] for entry in entries]
+                moved: Optional[List[Tensor]] = None
+                if foreach_copy is not None:
+                    destinations = [torch.empty_like(t, device=device) for t in tensors]
+                    try:
+                        foreach_copy(destinations, tensors, non_blocking=True)
+                    except TypeError:
+                        # older ``_foreach_copy_`` signatures do not accept ``non_blocking``
+                        foreach_copy(destinations, tensors)
+                    moved = destinations
+                else:
+                    flat = _flatten_dense_tensors(tensors)
+                    if source_device.type == "cpu" and not flat.is_pinned():
+                        # stage through pinned memory so the host-to-device copy can run asynchronously
+                        flat = flat.pin_memory()
+                        if staging is not None:
+                            staging.append(flat)
+                    flat = flat.to(device, non_blocking=True)
+                    moved = _unflatten_dense_tensors(flat, tensors)
+                for (state, key, _), destination in zip(entries, moved):
+                    state[key] = destination
+
     def dispatch(self, trainer: "pl.Trainer") -> None:
         """Hook to do something before the training/evaluation/prediction starts."""
         self.training_type_plugin.dispatch(trainer)
@@ -115,6 +434,8 @@ class Accelerator:
     @model.setter
     def model(self, new_model: Module) -> None:
         self.training_type_plugin.model = new_model
+        self._lightning_module = None
+        self._root_device = None
 
     @property
     def lightning_module(self) -> "pl.LightningModule":
@@ -122,12 +443,16 @@ class Accelerator:
 
         To get the potentially wrapped model use :attr:`Accelerator.model`
         """
-        return self.training_type_plugin.lightning_module
+        if self._lightning_module is None:
+            self._lightning_module = self.training_type_plugin.lightning_module
+        return self._lightning_module
 
     @property
     def root_device(self) -> torch.device:
         """Returns the root device."""
-        return self.training_type_plugin.root_device
+        if self._root_device is None:
+            self._root_device = self.training_type_plugin.root_device
+        return self._root_device
 
     def teardown(self) -> None:
         """This method is called to teardown the training process.
@@ -148,43 +473,72 @@ class Accelerator:
         model = self.lightning_module
         device = device or self.root_device
 
-        if model is not None and not isinstance(self.training_type_plugin, DataParallelPlugin):
+        if model is not None and not self._is_data_parallel:
+            if not self._has_custom_batch_transfer:
+                # the default hooks only move the data, skip the hook dispatch entirely
+                return self._move_to_device(batch, device)
             # no need to transfer batch to device in DP mode
             return model._apply_batch_transfer_handler(batch, device=device, dataloader_idx=dataloader_idx)
 
-        return move_data_to_device(batch, device)
-
-    def training_step(self, step_kwargs: Dict[str, Union[Any, int]]) -> STEP_OUTPUT:
+        return self._move_to_device(batch, device)
+
+    def _move_to_device(self, batch: Any, device: torch.device) -> Any:
+        """Moves a batch to the device, re-using a compiled schema of the batch structure when possible."""
+        schema = self._batch_schema_cache
+        if schema is None:
+            schema = _compile_batch_schema(batch)
+            # ``False`` marks structures that cannot be compiled, so they are not re-analyzed every batch
+            self._batch_schema_cache = schema if schema is not None else False
+        if not schema:
+            return move_data_to_device(batch, device)
+        collect, rebuild = schema
+        try:
+            leaves: List[Tensor] = []
+            collect(batch, leaves)
+        except _BatchSchemaMismatch:
+            # the structure changed (e.g. a different dataloader), recompile from the next batch
+            self._batch_schema_cache = None
+            return move_data_to_device(batch, device)
+        moved = iter([t.to(device, non_blocking=True) for t in leaves])
+        return rebuild(batch, moved)
+
+    def training_step(self, step_args: Tuple[Any, ...]) -> STEP_OUTPUT:
         """The actual training step.
 
         See :meth:`~pytorch_lightning.core.lightning.LightningModule.training_step` for more details
         """
+        step_args = _step_args_to_tuple(step_args, "training_step")
         with self.precision_plugin.train_step_context():
-            return self.training_type_plugin.training_step(*step_kwargs.values())
+            if self.training_type_plugin.supports_pipeline:
+                return self.training_type_plugin.run_microbatch_schedule(*step_args)
+            return self.training_type_plugin.training_step(*step_args)
 
-    def validation_step(self, step_kwargs: Dict[str, Union[Any, int]]) -> Optional[STEP_OUTPUT]:
+    def validation_step(self, step_args: Tuple[Any, ...]) -> Optional[STEP_OUTPUT]:
         """The actual validation step.
 
         See :meth:`~pytorch_lightning.core.lightning.LightningModule.validation_step` for more details
         """
+        step_args = _step_args_to_tuple(step_args, "validation_step")
         with self.precision_plugin.val_step_context():
-            return self.training_type_plugin.validation_step(*step_kwargs.values())
+            return self.training_type_plugin.validation_step(*step_args)
 
-    def test_step(self, step_kwargs: Dict[str, Union[Any, int]]) -> Optional[STEP_OUTPUT]:
+    def test_step(self, step_args: Tuple[Any, ...]) -> Optional[STEP_OUTPUT]:
         """The actual test step.
 
         See :meth:`~pytorch_lightning.core.lightning.LightningModule.test_step` for more details
         """
+        step_args = _step_args_to_tuple(step_args, "test_step")
         with self.precision_plugin.test_step_context():
-            return self.training_type_plugin.test_step(*step_kwargs.values())
+            return self.training_type_plugin.test_step(*step_args)
 
-    def predict_step(self, step_kwargs: Dict[str, Union[Any, int]]) -> STEP_OUTPUT:
+    def predict_step(self, step_args: Tuple[Any, ...]) -> STEP_OUTPUT:
         """The actual predict step.
 
         See :meth:`~pytorch_lightning.core.lightning.LightningModule.predict_step` for more details
         """
+        step_args = _step_args_to_tuple(step_args, "predict_step")
         with self.precision_plugin.predict_step_context():
-            return self.training_type_plugin.predict_step(*step_kwargs.values())
+            return self.training_type_plugin.predict_step(*step_args)
 
     def backward(self, closure_loss: Tensor, *args: Any, **kwargs: Any) -> Tensor:
         """Forwards backward-calls to the precision plugin.
@@ -192,15 +546,9 @@ class Accelerator:
         Args:
             closure_loss: a tensor holding the loss value to backpropagate
         """
-        self.training_type_plugin.pre_backward(closure_loss)
-        closure_loss = self.precision_plugin.pre_backward(self.lightning_module, closure_loss)
-
-        self.precision_plugin.backward(self.lightning_module, closure_loss, *args, **kwargs)
-
-        closure_loss = self.precision_plugin.post_backward(self.lightning_module, closure_loss)
-        self.training_type_plugin.post_backward(closure_loss)
-
-        return closure_loss
+        return self.training_type_plugin.run_backward(
+            self.precision_plugin, self.lightning_module, closure_loss, *args, **kwargs
+        )
 
     def optimizer_step(
         self,
@@ -244,22 +592,40 @@ class Accelerator:
 
     def setup_training_type_plugin(self) -> None:
         """Attaches the training type plugin to the accelerator."""
+        if self._bucket_cap_mb is not None:
+            # local imports to keep the module import light, see ``__init__``
+            from pytorch_lightning.plugins.training_type.ddp import DDPPlugin
+            from pytorch_lightning.plugins.training_type.ddp_spawn import DDPSpawnPlugin
+
+            # subclasses such as the sharded plugins forward ``_ddp_kwargs`` to wrappers that do not accept
+            # ``bucket_cap_mb``, so only plugins wrapping with ``DistributedDataParallel`` itself qualify
+            configure_ddp = getattr(type(self.training_type_plugin), "configure_ddp", None)
+            if configure_ddp not in (DDPPlugin.configure_ddp, DDPSpawnPlugin.configure_ddp):
+                raise MisconfigurationException(
+                    f"`bucket_cap_mb={self._bucket_cap_mb}` requires a DDP training type plugin,"
+                    f" got {self.training_type_plugin.__class__.__name__}."
+                )
+            # explicit plugin kwargs win over the accelerator-level knob
+            self.training_type_plugin._ddp_kwargs.setdefault("bucket_cap_mb", self._bucket_cap_mb)
         self.training_type_plugin.setup()
 
     def setup_precision_plugin(self) -> None:
         """Attaches the precision plugin to the accelerator."""
         model, optimizers, schedulers = self.precision_plugin.connect(self.model, self.optimizers, self.lr_schedulers)
-        self.model = model
-        self.optimizers = optimizers
-        self.lr_schedulers = schedulers
+        # only rebind what the plugin actually replaced: the ``model`` setter forwards to the training type plugin
+        # which may re-register parameters, and most plugins return the original objects untouched. the memoized
+        # model state does not rely on the setter running here, it is dropped in ``setup_environment`` on every run
+        if model is not self.model:
+            self.model = model
+        if optimizers is not self.optimizers:
+            self.optimizers = optimizers
+        if schedulers is not self.lr_schedulers:
+            self.lr_schedulers = schedulers
+        self._bind_step_contexts()
 
     @property
     def amp_backend(self) -> Optional[LightningEnum]:
-        if isinstance(self.precision_plugin, ApexMixedPrecisionPlugin):
-            return AMPType.APEX
-        if isinstance(self.precision_plugin, NativeMixedPrecisionPlugin):
-            return AMPType.NATIVE
-        return None
+        return self._amp_backend
 
     @property
     def precision(self) -> Union[str, int]:
@@ -267,14 +633,35 @@ class Accelerator:
 
     @property
     def scaler(self) -> Optional["GradScaler"]:
+        # not cached: plugins may replace their scaler after construction, e.g. in the spawned workers of
+        # the sharded spawn plugin
         return getattr(self.precision_plugin, "scaler", None)
 
+    def register_comm_hook(self, state: object, hook: Callable) -> None:
+        """Registers a communication hook on the wrapped :class:`~torch.nn.parallel.DistributedDataParallel` model.
+
+        This allows overlapping e.g. gradient compression or the optimizer step with the allreduce.
+        See :meth:`torch.nn.parallel.DistributedDataParallel.register_comm_hook` for the hook contract.
+
+        Raises:
+            MisconfigurationException:
+                If the model held by the training type plugin does not support communication hooks.
+        """
+        register_fn = getattr(self.model, "register_comm_hook", None)
+        if register_fn is None:
+            raise MisconfigurationException(
+                "`Accelerator.register_comm_hook` requires the model to be wrapped in `DistributedDataParallel`."
+            )
+        register_fn(state, hook)
+
     def optimizer_state(self, optimizer: Optimizer) -> Dict[str, Tensor]:
         """Returns state of an optimizer.
 
         Allows for syncing/collating optimizer state from processes in custom plugins.
         """
-        return getattr(self.training_type_plugin, "optimizer_state", lambda x: x.state_dict())(optimizer)
+        if self._optimizer_state_fn is not None:
+            return self._optimizer_state_fn(optimizer)
+        return optimizer.state_dict()
 
     @contextlib.contextmanager
     def model_sharded_context(self) -> Generator[None, None, None]:
@@ -30,6 +30,9 @@ if _XLA_AVAILABLE:
 class TPUAccelerator(Accelerator):
     """Accelerator for TPU devices."""
 
+    # the XLA optimizer state move below is synchronous, there is nothing to overlap
+    overlap_pre_dispatch = False
+
     def setup(self, trainer: "pl.Trainer") -> None:
         """
         Raises:
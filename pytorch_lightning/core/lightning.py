@@ -1607,7 +1607,9 @@ class LightningModule(
         """
         optimizer.step(closure=optimizer_closure)
 
-    def optimizer_zero_grad(self, epoch: int, batch_idx: int, optimizer: Optimizer, optimizer_idx: int):
+    def optimizer_zero_grad(
+        self, epoch: int, batch_idx: int, optimizer: Optimizer, optimizer_idx: int, set_to_none: bool = True
+    ):
         """Override this method to change the default behaviour of ``optimizer.zero_grad()``.
 
         Args:
@@ -1615,20 +1617,23 @@ class LightningModule(
             batch_idx: Index of current batch
             optimizer: A PyTorch optimizer
             optimizer_idx: If you used multiple optimizers this indexes into that list.
+            set_to_none: Whether the gradients are set to ``None`` instead of being filled with zeros. This skips
+                one parameter-sized memory write per iteration. Pass ``False`` to restore the in-place zeroing if
+                you rely on reading zeroed gradients.
 
         Examples::
 
             # DEFAULT
             def optimizer_zero_grad(self, epoch, batch_idx, optimizer, optimizer_idx):
-                optimizer.zero_grad()
+                optimizer.zero_grad(set_to_none=True)
 
-            # Set gradients to `None` instead of zero to improve performance.
+            # Fill the gradients with zeros in-place instead of setting them to `None`
             def optimizer_zero_grad(self, epoch, batch_idx, optimizer, optimizer_idx):
-                optimizer.zero_grad(set_to_none=True)
+                optimizer.zero_grad()
 
         See :meth:`torch.optim.Optimizer.zero_grad` for the explanation of the above example.
         """
-        optimizer.zero_grad()
+        optimizer.zero_grad(set_to_none=set_to_none)
 
     def tbptt_split_batch(self, batch: Any, split_size: int) -> List[Any]:
         r"""
@@ -0,0 +1,52 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from contextlib import contextmanager
+from typing import Generator, Optional
+
+from pytorch_lightning.plugins.precision.mixed import MixedPrecisionPlugin
+from pytorch_lightning.utilities import _TRANSFORMER_ENGINE_AVAILABLE, AMPType
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+
+if _TRANSFORMER_ENGINE_AVAILABLE:
+    import transformer_engine.pytorch as te
+
+
+class FP8MixedPrecisionPlugin(MixedPrecisionPlugin):
+    """Plugin for FP8 mixed precision training on Hopper-generation GPUs via NVIDIA Transformer Engine.
+
+    The forward pass runs inside Transformer Engine's ``fp8_autocast`` context, so ``transformer_engine`` modules
+    execute their matmuls in FP8 while gradients keep higher precision. No loss scaler is used.
+
+    Args:
+        recipe: An optional ``transformer_engine.common.recipe.DelayedScaling`` recipe controlling the FP8 scaling
+            behaviour. Uses Transformer Engine's default recipe when ``None``.
+    """
+
+    backend = AMPType.FP8
+    precision = "fp8"
+
+    def __init__(self, recipe: Optional[object] = None) -> None:
+        if not _TRANSFORMER_ENGINE_AVAILABLE:
+            raise MisconfigurationException(
+                "To use FP8 mixed precision, you must have `transformer-engine` installed."
+                " Install it by running `pip install transformer-engine`."
+            )
+        super().__init__()
+        self.recipe = recipe
+
+    @contextmanager
+    def forward_context(self) -> Generator[None, None, None]:
+        """Enable the Transformer Engine FP8 autocast context."""
+        with te.fp8_autocast(enabled=True, fp8_recipe=self.recipe):
+            yield
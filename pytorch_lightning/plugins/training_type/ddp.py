@@ -47,6 +47,7 @@ from pytorch_lightning.utilities import (
     _TORCH_GREATER_EQUAL_1_8,
     _TORCH_GREATER_EQUAL_1_9,
     _TORCH_GREATER_EQUAL_1_10,
+    AMPType,
     rank_zero_warn,
 )
 from pytorch_lightning.utilities.distributed import distributed_available
@@ -266,6 +267,21 @@ class DDPPlugin(ParallelPlugin):
                 "to properly work with DDP."
             )
             self._ddp_kwargs["find_unused_parameters"] = True
+        if _TORCH_GREATER_EQUAL_1_9 and self.lightning_module.trainer.amp_backend != AMPType.APEX:
+            # gradients are written directly into the allreduce buckets, saving one grad <-> bucket copy each way.
+            # apex amp is excluded as it rewrites the ``.grad`` fields which breaks the bucket views. 1.9 is the
+            # first release where bucket views support gradients being set to ``None`` by ``optimizer_zero_grad``
+            self._ddp_kwargs.setdefault("gradient_as_bucket_view", True)
+        if (
+            self._ddp_comm_hook is None
+            and _TORCH_GREATER_EQUAL_1_8
+            and self.root_device.type == "cuda"
+            and self.lightning_module.trainer.precision == 16
+        ):
+            from torch.distributed.algorithms.ddp_comm_hooks import default_hooks as default
+
+            # halve the gradient communication volume when already training in fp16
+            self._ddp_comm_hook = default.fp16_compress_hook
 
     def _register_ddp_hooks(self) -> None:
         # In 1.8, DDP communication hooks only work with NCCL backend and SPSD (single process single device) mode
@@ -32,7 +32,13 @@ from pytorch_lightning.plugins.environments.cluster_environment import ClusterEn
 from pytorch_lightning.plugins.io.checkpoint_plugin import CheckpointIO
 from pytorch_lightning.plugins.training_type.parallel import ParallelPlugin
 from pytorch_lightning.trainer.states import TrainerFn
-from pytorch_lightning.utilities import _TORCH_GREATER_EQUAL_1_7, _TORCH_GREATER_EQUAL_1_8, rank_zero_warn
+from pytorch_lightning.utilities import (
+    _TORCH_GREATER_EQUAL_1_7,
+    _TORCH_GREATER_EQUAL_1_8,
+    _TORCH_GREATER_EQUAL_1_9,
+    AMPType,
+    rank_zero_warn,
+)
 from pytorch_lightning.utilities.apply_func import apply_to_collection, move_data_to_device
 from pytorch_lightning.utilities.cloud_io import atomic_save
 from pytorch_lightning.utilities.cloud_io import load as pl_load
@@ -249,6 +255,21 @@ class DDPSpawnPlugin(ParallelPlugin):
                 "to properly work with DDP."
             )
             self._ddp_kwargs["find_unused_parameters"] = True
+        if _TORCH_GREATER_EQUAL_1_9 and self.lightning_module.trainer.amp_backend != AMPType.APEX:
+            # gradients are written directly into the allreduce buckets, saving one grad <-> bucket copy each way.
+            # apex amp is excluded as it rewrites the ``.grad`` fields which breaks the bucket views. 1.9 is the
+            # first release where bucket views support gradients being set to ``None`` by ``optimizer_zero_grad``
+            self._ddp_kwargs.setdefault("gradient_as_bucket_view", True)
+        if (
+            self._ddp_comm_hook is None
+            and _TORCH_GREATER_EQUAL_1_8
+            and self.root_device.type == "cuda"
+            and self.lightning_module.trainer.precision == 16
+        ):
+            from torch.distributed.algorithms.ddp_comm_hooks import default_hooks as default
+
+            # halve the gradient communication volume when already training in fp16
+            self._ddp_comm_hook = default.fp16_compress_hook
 
     def _register_ddp_hooks(self) -> None:
         # currently, DDP communication hooks only work with NCCL backend and SPSD (single process single device) mode
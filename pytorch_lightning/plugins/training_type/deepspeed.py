@@ -389,6 +389,11 @@ class DeepSpeedPlugin(DDPPlugin):
     def restore_checkpoint_after_pre_dispatch(self) -> bool:
         return True
 
+    @property
+    def pre_dispatch_uses_optimizer_state(self) -> bool:
+        # the deepspeed engine is initialized with the optimizers below
+        return True
+
     def pre_dispatch(self):
         self.init_deepspeed()
         self.barrier()
@@ -69,6 +69,11 @@ class HorovodPlugin(ParallelPlugin):
     def setup(self) -> None:
         self.model_to_device()
 
+    @property
+    def pre_dispatch_uses_optimizer_state(self) -> bool:
+        # the optimizer state is broadcast from rank 0 below, it must be fully materialized on the device
+        return True
+
     def pre_dispatch(self):
 
         if not self.lightning_module.trainer.training:
@@ -115,6 +115,11 @@ class IPUPlugin(ParallelPlugin):
         # to use the simpler solution before adding abstractions to override the `DataLoader` class
         self.lightning_module.trainer._update_dataloader = self._convert_to_poptorch_loader
 
+    @property
+    def pre_dispatch_uses_optimizer_state(self) -> bool:
+        # the poptorch training model is compiled with the optimizer below
+        return True
+
     def pre_dispatch(self) -> None:
         precision = self.lightning_module.trainer.precision
         model = LightningIPUModule(self.lightning_module, precision)
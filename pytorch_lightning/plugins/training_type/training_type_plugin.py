@@ -13,7 +13,7 @@
 # limitations under the License.
 import contextlib
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Generator, Iterable, List, Mapping, Optional, Tuple, Union
+from typing import Any, Dict, Generator, Iterable, List, Mapping, Optional, Tuple, TYPE_CHECKING, Union
 
 import torch
 from torch import Tensor
@@ -28,6 +28,9 @@ from pytorch_lightning.plugins.io.checkpoint_plugin import CheckpointIO
 from pytorch_lightning.utilities.distributed import ReduceOp
 from pytorch_lightning.utilities.types import _EVALUATE_OUTPUT, _PATH, _PREDICT_OUTPUT
 
+if TYPE_CHECKING:
+    from pytorch_lightning.plugins.precision import PrecisionPlugin
+
 
 class TrainingTypePlugin(ABC):
     """Base class for all training type plugins that change the behaviour of the training, validation and test-
@@ -156,6 +159,27 @@ class TrainingTypePlugin(ABC):
     def pre_backward(self, closure_loss: torch.Tensor) -> None:
         """Run before precision plugin executes backward."""
 
+    def run_backward(
+        self,
+        precision_plugin: "PrecisionPlugin",
+        lightning_module: "pl.LightningModule",
+        closure_loss: torch.Tensor,
+        *args: Any,
+        **kwargs: Any,
+    ) -> torch.Tensor:
+        """Runs the complete backward sequence in a single call.
+
+        This executes the plugin and precision-plugin backward hooks in order, which saves the accelerator one
+        method dispatch per hook on every backward. The individual hooks remain the extension points for
+        subclasses.
+        """
+        self.pre_backward(closure_loss)
+        closure_loss = precision_plugin.pre_backward(lightning_module, closure_loss)
+        precision_plugin.backward(lightning_module, closure_loss, *args, **kwargs)
+        closure_loss = precision_plugin.post_backward(lightning_module, closure_loss)
+        self.post_backward(closure_loss)
+        return closure_loss
+
     def post_backward(self, closure_loss: torch.Tensor) -> None:
         """Run after precision plugin executes backward."""
 
@@ -278,6 +302,30 @@ class TrainingTypePlugin(ABC):
         """Whether the plugin handles gradient accumulation internally."""
         return False
 
+    @property
+    def pre_dispatch_uses_optimizer_state(self) -> bool:
+        """Whether :meth:`pre_dispatch` reads or broadcasts the optimizer state.
+
+        When ``True``, the accelerator finishes any in-flight optimizer state transfer before calling
+        :meth:`pre_dispatch` instead of overlapping the two.
+        """
+        return False
+
+    @property
+    def supports_pipeline(self) -> bool:
+        """Whether the plugin runs a microbatch schedule instead of a single forward per training step."""
+        return False
+
+    def run_microbatch_schedule(self, *args, **kwargs) -> Optional[Any]:
+        """Runs the plugin's microbatch schedule over a full training batch.
+
+        Pipeline-parallel plugins override this together with :attr:`supports_pipeline`. The schedule splits the
+        batch into microbatches and interleaves their forward and backward passes across the pipeline stages, so
+        such plugins also handle the backward pass here and typically return ``handles_gradient_accumulation`` as
+        ``True``.
+        """
+        raise NotImplementedError(f"`{self.__class__.__name__}` does not implement a microbatch schedule.")
+
     def lightning_module_state_dict(self) -> Dict[str, Union[Any, Tensor]]:
         """Returns model state."""
         model = self.lightning_module
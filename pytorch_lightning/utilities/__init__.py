@@ -52,6 +52,7 @@ from pytorch_lightning.utilities.imports import (  # noqa: F401
     _TORCHTEXT_AVAILABLE,
     _TORCHVISION_AVAILABLE,
     _TPU_AVAILABLE,
+    _TRANSFORMER_ENGINE_AVAILABLE,
     _XLA_AVAILABLE,
 )
 from pytorch_lightning.utilities.parameter_tying import find_shared_parameters, set_shared_parameters  # noqa: F401
@@ -47,6 +47,8 @@ class AMPType(LightningEnum):
 
     APEX = "apex"
     NATIVE = "native"
+    BF16 = "bf16"
+    FP8 = "fp8"
 
 
 class PrecisionType(LightningEnum):
@@ -96,6 +96,7 @@ _RICH_AVAILABLE = _module_available("rich") and _compare_version("rich", operato
 _TORCH_QUANTIZE_AVAILABLE = bool([eg for eg in torch.backends.quantized.supported_engines if eg != "none"])
 _TORCHTEXT_AVAILABLE = _module_available("torchtext")
 _TORCHVISION_AVAILABLE = _module_available("torchvision")
+_TRANSFORMER_ENGINE_AVAILABLE = _module_available("transformer_engine.pytorch")
 _XLA_AVAILABLE: bool = _module_available("torch_xla")
 
 from pytorch_lightning.utilities.xla_device import XLADeviceUtils  # noqa: E402
@@ -85,3 +85,130 @@ def test_restore_checkpoint_after_pre_dispatch(tmpdir, restore_after_pre_dispatc
     for func in (trainer.test, trainer.validate, trainer.predict):
         accelerator.training_type_plugin.predispatched_called = False
         func(model, ckpt_path=checkpoint_path)
+
+
+def test_batch_to_device_schema_cache():
+    """Test that moving batches of a stable structure compiles and re-uses a schema, and that a structure change
+    falls back to the generic path."""
+    plugin = SingleDevicePlugin(torch.device("cpu"))
+    accelerator = CPUAccelerator(training_type_plugin=plugin, precision_plugin=PrecisionPlugin())
+    device = torch.device("cpu")
+
+    batch = {"data": torch.rand(2, 4), "extras": [0, "id", (torch.rand(1), None)]}
+    moved = accelerator._move_to_device(batch, device)
+    assert accelerator._batch_schema_cache
+    assert torch.equal(moved["data"], batch["data"])
+    assert moved["extras"][:2] == [0, "id"]
+    assert torch.equal(moved["extras"][2][0], batch["extras"][2][0])
+
+    # the same structure is served by the compiled schema
+    schema = accelerator._batch_schema_cache
+    accelerator._move_to_device(batch, device)
+    assert accelerator._batch_schema_cache is schema
+
+    # a different structure invalidates the cache and still gets moved correctly
+    other = [torch.rand(2), torch.rand(2)]
+    moved = accelerator._move_to_device(other, device)
+    assert accelerator._batch_schema_cache is None
+    assert torch.equal(moved[0], other[0])
+
+    # a leaf compiled as a constant must invalidate the schema when it later carries tensors
+    accelerator._move_to_device({"data": torch.rand(2), "meta": None}, device)
+    assert accelerator._batch_schema_cache
+    batch = {"data": torch.rand(2), "meta": [torch.rand(2)]}
+    moved = accelerator._move_to_device(batch, device)
+    assert accelerator._batch_schema_cache is None
+    assert torch.equal(moved["meta"][0], batch["meta"][0])
+
+
+@pytest.mark.parametrize("override_hook", [None, "on_before_batch_transfer", "transfer_batch_to_device"])
+def test_batch_to_device_hook_fast_path(tmpdir, override_hook):
+    """Test that the hook dispatch in ``batch_to_device`` is only skipped when no batch-transfer hook is
+    overridden."""
+
+    class HookModel(BoringModel):
+        pass
+
+    if override_hook is not None:
+
+        def hook(self, batch, *args, **kwargs):
+            return batch
+
+        setattr(HookModel, override_hook, hook)
+
+    model = HookModel()
+    trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=True)
+    trainer.fit(model)
+    assert trainer.accelerator._has_custom_batch_transfer is (override_hook is not None)
+
+
+def test_accelerator_bucket_cap_mb(monkeypatch, tmpdir):
+    """Test that ``bucket_cap_mb`` is forwarded to the DDP kwargs and rejected for non-DDP plugins."""
+    from pytorch_lightning.plugins import DDPPlugin
+    from pytorch_lightning.utilities.exceptions import MisconfigurationException
+
+    plugin = DDPPlugin()
+    monkeypatch.setattr(plugin, "setup", lambda: None)
+    accelerator = CPUAccelerator(training_type_plugin=plugin, precision_plugin=PrecisionPlugin(), bucket_cap_mb=50)
+    accelerator.setup_training_type_plugin()
+    assert plugin._ddp_kwargs["bucket_cap_mb"] == 50
+
+    # an explicit plugin kwarg wins over the accelerator-level knob
+    plugin = DDPPlugin(bucket_cap_mb=100)
+    monkeypatch.setattr(plugin, "setup", lambda: None)
+    accelerator = CPUAccelerator(training_type_plugin=plugin, precision_plugin=PrecisionPlugin(), bucket_cap_mb=50)
+    accelerator.setup_training_type_plugin()
+    assert plugin._ddp_kwargs["bucket_cap_mb"] == 100
+
+    accelerator = CPUAccelerator(
+        training_type_plugin=SingleDevicePlugin(torch.device("cpu")),
+        precision_plugin=PrecisionPlugin(),
+        bucket_cap_mb=50,
+    )
+    with pytest.raises(MisconfigurationException, match="requires a DDP training type plugin"):
+        accelerator.setup_training_type_plugin()
+
+    # plugins that wrap the model with something other than DistributedDataParallel do not qualify,
+    # even when they inherit ``_ddp_kwargs`` (e.g. the sharded plugins)
+    class WrappingPlugin(DDPPlugin):
+        def configure_ddp(self):
+            pass
+
+    accelerator = CPUAccelerator(
+        training_type_plugin=WrappingPlugin(), precision_plugin=PrecisionPlugin(), bucket_cap_mb=50
+    )
+    with pytest.raises(MisconfigurationException, match="requires a DDP training type plugin"):
+        accelerator.setup_training_type_plugin()
+
+
+def test_accelerator_specialized_steps_pickleable():
+    """Test that the step methods are only specialized at setup time and survive pickling, as required by the
+    spawn plugins."""
+    import inspect
+    import pickle
+
+    accelerator = CPUAccelerator(
+        training_type_plugin=SingleDevicePlugin(torch.device("cpu")), precision_plugin=PrecisionPlugin()
+    )
+    # construction must stay lazy, the generic step methods remain in place until setup
+    assert inspect.ismethod(accelerator.training_step)
+
+    accelerator.setup_precision_plugin()
+    assert accelerator.training_step.step_fn.__self__ is accelerator.training_type_plugin
+
+    restored = pickle.loads(pickle.dumps(accelerator))
+    assert restored.training_step.step_fn.__self__ is restored.training_type_plugin
+
+
+def test_accelerator_model_caches_follow_trainer_reuse(tmpdir):
+    """Test that a reused trainer serves the newly attached module, not the memoized one from the previous
+    run."""
+    trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=True)
+
+    model_a = BoringModel()
+    trainer.fit(model_a)
+    assert trainer.lightning_module is model_a
+
+    model_b = BoringModel()
+    trainer.validate(model_b)
+    assert trainer.lightning_module is model_b
@@ -0,0 +1,32 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test deprecated functionality which will be removed in v1.8.0."""
+from collections import OrderedDict
+
+import pytest
+import torch
+
+from pytorch_lightning import Trainer
+from tests.helpers import BoringModel
+
+
+def test_v1_8_0_deprecated_accelerator_step_kwargs_dict(tmpdir):
+    model = BoringModel()
+    trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=True)
+    trainer.fit(model)
+
+    batch = torch.rand(2, 32, device=model.device)
+    step_kwargs = OrderedDict([("batch", batch), ("batch_idx", 0)])
+    with pytest.deprecated_call(match="Passing a dictionary of arguments to `Accelerator.training_step`"):
+        trainer.accelerator.training_step(step_kwargs)
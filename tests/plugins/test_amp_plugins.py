@@ -275,3 +275,11 @@ def test_precision_selection_raises(monkeypatch):
         MisconfigurationException, match="asked for Apex AMP but you have not installed it"
     ):
         Trainer(amp_backend="apex", precision=16, gpus=1)
+
+
+def test_precision_fp8_raises_without_transformer_engine(monkeypatch):
+    import pytorch_lightning.plugins.precision.fp8 as fp8
+
+    monkeypatch.setattr(fp8, "_TRANSFORMER_ENGINE_AVAILABLE", False)
+    with pytest.raises(MisconfigurationException, match="must have `transformer-engine` installed"):
+        fp8.FP8MixedPrecisionPlugin()